@@ -0,0 +1,39 @@
+"""
+Authentication classes for the RemoveList API.
+"""
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+USER_CACHE_TIMEOUT = 60  # seconds
+
+
+def user_cache_key(user_id):
+    """Return the cache key holding the authenticated user for an id."""
+    return f'user:{user_id}'
+
+
+def invalidate_cached_user(user_id):
+    """Drop a cached user so the next request reloads it from the database."""
+    cache.delete(user_cache_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that caches the resolved user for a short period
+    instead of loading it from the database on every request.
+    """
+    
+    def get_user(self, validated_token):
+        """Return the token's user from cache, falling back to the database."""
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            # Let the parent raise the usual InvalidToken error
+            return super().get_user(validated_token)
+        
+        key = user_cache_key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(key, user, USER_CACHE_TIMEOUT)
+        return user
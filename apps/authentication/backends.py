@@ -0,0 +1,36 @@
+"""
+Authentication backends for the RemoveList application.
+"""
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+UserModel = get_user_model()
+
+
+class LoginModelBackend(ModelBackend):
+    """
+    Model backend that loads only the user columns the login flow reads.
+    """
+    login_fields = (
+        'id', 'email', 'password', 'is_active', 'is_email_verified',
+        'first_name', 'last_name', 'avatar'
+    )
+    
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        """Authenticate by email, fetching a narrowed user row."""
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = UserModel._default_manager.only(*self.login_fields).get(
+                **{UserModel.USERNAME_FIELD: username}
+            )
+        except UserModel.DoesNotExist:
+            # Run the default password hasher once to reduce the timing
+            # difference between an existing and a nonexistent user.
+            UserModel().set_password(password)
+        else:
+            if user.check_password(password) and self.user_can_authenticate(user):
+                return user
+        return None
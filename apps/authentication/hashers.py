@@ -0,0 +1,14 @@
+"""
+Password hashers for the RemoveList application.
+"""
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id hasher tuned to keep login hashing around 250ms while
+    spreading the work over two lanes.
+    """
+    time_cost = 2
+    memory_cost = 65536  # KiB
+    parallelism = 2
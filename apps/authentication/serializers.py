@@ -5,8 +5,10 @@ from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from .models import User
-from apps.common.validators import validate_phone_number, validate_name
+from apps.common.utils import CachedFieldsMixin, UpdateFieldsMixin
+from apps.common.validators import validate_phone_number
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -23,28 +25,16 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             'email', 'phone_number', 'password', 'confirm_password',
             'first_name', 'last_name', 'agree_to_terms'
         ]
-    
-    def validate_email(self, value):
-        """Validate email uniqueness."""
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("This email is already registered")
-        return value
+        # Uniqueness is enforced by the database constraint in create()
+        extra_kwargs = {
+            'email': {'validators': []},
+        }
     
     def validate_phone_number(self, value):
         """Validate phone number format."""
         validate_phone_number(value)
         return value
     
-    def validate_first_name(self, value):
-        """Validate first name."""
-        validate_name(value)
-        return value
-    
-    def validate_last_name(self, value):
-        """Validate last name."""
-        validate_name(value)
-        return value
-    
     def validate_agree_to_terms(self, value):
         """Validate terms agreement."""
         if not value:
@@ -64,10 +54,16 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         validated_data.pop('confirm_password')
         validated_data.pop('agree_to_terms')
         
-        user = User.objects.create_user(
-            username=validated_data['email'],  # Django requires username
-            **validated_data
-        )
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=validated_data['email'],  # Django requires username
+                    **validated_data
+                )
+        except IntegrityError:
+            raise serializers.ValidationError({
+                'email': ['This email is already registered']
+            })
         return user
 
 
@@ -104,7 +100,7 @@ class UserLoginSerializer(serializers.Serializer):
             })
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(CachedFieldsMixin, UpdateFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for user profile.
     """
@@ -120,16 +116,6 @@ class UserProfileSerializer(serializers.ModelSerializer):
         """Validate phone number format."""
         validate_phone_number(value)
         return value
-    
-    def validate_first_name(self, value):
-        """Validate first name."""
-        validate_name(value)
-        return value
-    
-    def validate_last_name(self, value):
-        """Validate last name."""
-        validate_name(value)
-        return value
 
 
 class ChangePasswordSerializer(serializers.Serializer):
@@ -176,7 +162,7 @@ class ResetPasswordSerializer(serializers.Serializer):
     new_password = serializers.CharField(validators=[validate_password])
 
 
-class AvatarUploadSerializer(serializers.ModelSerializer):
+class AvatarUploadSerializer(UpdateFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for avatar upload.
     """
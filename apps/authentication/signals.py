@@ -0,0 +1,14 @@
+"""
+Signal handlers for the authentication app.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .authentication import invalidate_cached_user
+from .models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def drop_cached_user(sender, instance, **kwargs):
+    """Drop the cached user whenever its row is written or deleted."""
+    invalidate_cached_user(instance.pk)
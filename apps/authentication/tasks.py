@@ -1,25 +1,31 @@
 """
 Celery tasks for authentication-related email sending.
 """
+import secrets
 from celery import shared_task
 from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.conf import settings
 from django.contrib.auth import get_user_model
 import logging
+from .models import EmailVerificationToken, PasswordResetToken
+from apps.bookings.models import Booking
 
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
 
 @shared_task
-def send_verification_email(user_id, token):
+def send_verification_email(user_id):
     """
-    Send email verification email.
+    Create a verification token and send the email verification email.
     """
     try:
         user = User.objects.get(id=user_id)
         
+        token = secrets.token_urlsafe(32)
+        EmailVerificationToken.objects.create(user=user, token=token)
+        
         verification_link = f"{settings.FRONTEND_URL}/verify-email?token={token}"
         
         # Render HTML email
@@ -47,13 +53,16 @@ def send_verification_email(user_id, token):
 
 
 @shared_task
-def send_password_reset_email(user_id, token):
+def send_password_reset_email(user_id):
     """
-    Send password reset email.
+    Create a password reset token and send the password reset email.
     """
     try:
         user = User.objects.get(id=user_id)
         
+        token = secrets.token_urlsafe(32)
+        PasswordResetToken.objects.create(user=user, token=token)
+        
         # Fix: Use path parameter instead of query parameter to match frontend routing
         reset_link = f"{settings.FRONTEND_URL}/reset-password/confirm/{token}"
         
@@ -83,27 +92,29 @@ def send_password_reset_email(user_id, token):
 
 
 @shared_task
-def send_booking_confirmation_email(user_id, booking_data):
+def send_booking_confirmation_email(booking_id):
     """
     Send booking confirmation email.
     """
     try:
-        user = User.objects.get(id=user_id)
+        booking = Booking.objects.select_related('user').get(id=booking_id)
+        user = booking.user
+        move_date = booking.date.strftime('%B %d, %Y')
         
         # Render HTML email
         html_message = render_to_string('emails/booking_confirmation_email.html', {
             'first_name': user.first_name,
-            'move_date': booking_data['move_date'],
-            'time_slot': booking_data['time_slot'],
-            'confirmation_number': booking_data['confirmation_number'],
-            'phone_number': booking_data['phone_number'],
+            'move_date': move_date,
+            'time_slot': booking.time_slot_display,
+            'confirmation_number': booking.confirmation_number,
+            'phone_number': booking.phone_number,
             'contact_info': 'For questions, contact us at support@removealist.com or call (555) 123-4567',
         })
         
         # Send email
         send_mail(
             subject='Booking Confirmed - RemoveList',
-            message=f"Hi {user.first_name},\n\nYour move has been scheduled for {booking_data['move_date']} at {booking_data['time_slot']}. Confirmation: {booking_data['confirmation_number']}",
+            message=f"Hi {user.first_name},\n\nYour move has been scheduled for {move_date} at {booking.time_slot_display}. Confirmation: {booking.confirmation_number}",
             from_email=settings.DEFAULT_FROM_EMAIL,
             recipient_list=[user.email],
             html_message=html_message,
@@ -112,8 +123,8 @@ def send_booking_confirmation_email(user_id, booking_data):
         
         logger.info(f"Booking confirmation email sent to {user.email}")
         
-    except User.DoesNotExist:
-        logger.error(f"User with id {user_id} not found")
+    except Booking.DoesNotExist:
+        logger.error(f"Booking with id {booking_id} not found")
     except Exception as e:
         logger.error(f"Failed to send booking confirmation email: {str(e)}")
 
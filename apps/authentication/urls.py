@@ -21,7 +21,6 @@ urlpatterns = [
     path('change-password/', views.change_password, name='change_password'),
     
     # Profile management
-    path('profile/', views.profile, name='profile'),
-    path('profile/', views.update_profile, name='update_profile'),  # Same URL, different methods
+    path('profile/', views.profile, name='profile'),  # GET and PUT
     path('profile/avatar/', views.upload_avatar, name='upload_avatar'),
 ]
@@ -1,8 +1,7 @@
 """
 Authentication views for the RemoveList application.
 """
-import secrets
-from rest_framework import status
+from rest_framework import serializers, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -15,7 +14,6 @@ from .serializers import (
     ChangePasswordSerializer, EmailVerificationSerializer, ResendEmailSerializer,
     ForgotPasswordSerializer, ResetPasswordSerializer, AvatarUploadSerializer
 )
-# Import functions directly instead of Celery tasks
 from .tasks import send_verification_email, send_password_reset_email
 from apps.common.utils import success_response, error_response
 
@@ -31,18 +29,18 @@ def register_email(request):
     serializer = UserRegistrationSerializer(data=request.data)
     
     if serializer.is_valid():
-        user = serializer.save()
-        
-        # Create verification token
-        token = secrets.token_urlsafe(32)
-        EmailVerificationToken.objects.create(
-            user=user,
-            token=token
-        )
+        try:
+            user = serializer.save()
+        except serializers.ValidationError as e:
+            return error_response(
+                "Registration failed",
+                e.detail,
+                status.HTTP_400_BAD_REQUEST
+            )
         
-        # Send verification email (direct call instead of Celery task)
+        # Create the verification token and send the email in the background
         try:
-            send_verification_email(user.id, token)
+            send_verification_email.delay(str(user.id))
         except Exception as e:
             # Log error but don't fail registration
             print(f"Failed to send verification email: {e}")
@@ -83,13 +81,14 @@ def login(request):
                 status.HTTP_400_BAD_REQUEST
             )
         
-        # Generate JWT tokens
+        # Generate JWT tokens; each token is signed exactly once
         refresh = RefreshToken.for_user(user)
+        access = refresh.access_token
         
         return success_response(
             "Login successful!",
             {
-                'access_token': str(refresh.access_token),
+                'access_token': str(access),
                 'refresh_token': str(refresh),
                 'user': {
                     'id': str(user.id),
@@ -121,7 +120,7 @@ def verify_email(request):
         token = serializer.validated_data['token']
         
         try:
-            verification_token = EmailVerificationToken.objects.get(token=token)
+            verification_token = EmailVerificationToken.objects.select_related('user').get(token=token)
             
             if verification_token.is_used:
                 return error_response(
@@ -139,11 +138,11 @@ def verify_email(request):
             
             # Mark token as used and verify user
             verification_token.is_used = True
-            verification_token.save()
+            verification_token.save(update_fields=['is_used'])
             
             user = verification_token.user
             user.is_email_verified = True
-            user.save()
+            user.save(update_fields=['is_email_verified', 'updated_at'])
             
             return success_response(
                 "Email verified successfully",
@@ -183,16 +182,9 @@ def resend_email(request):
                     "If your email is registered, a verification link has been sent."
                 )
             
-            # Create new verification token
-            token = secrets.token_urlsafe(32)
-            EmailVerificationToken.objects.create(
-                user=user,
-                token=token
-            )
-            
-            # Send verification email (direct call instead of Celery task)
+            # Create a new token and send the email in the background
             try:
-                send_verification_email(user.id, token)
+                send_verification_email.delay(str(user.id))
             except Exception as e:
                 print(f"Failed to send verification email: {e}")
             
@@ -224,16 +216,9 @@ def forgot_password(request):
         try:
             user = User.objects.get(email=email)
             
-            # Create password reset token
-            token = secrets.token_urlsafe(32)
-            PasswordResetToken.objects.create(
-                user=user,
-                token=token
-            )
-            
-            # Send password reset email (direct call instead of Celery task)
+            # Create the reset token and send the email in the background
             try:
-                send_password_reset_email(user.id, token)
+                send_password_reset_email.delay(str(user.id))
             except Exception as e:
                 print(f"Failed to send password reset email: {e}")
             
@@ -264,7 +249,7 @@ def reset_password(request):
         new_password = serializer.validated_data['new_password']
         
         try:
-            reset_token = PasswordResetToken.objects.get(token=token)
+            reset_token = PasswordResetToken.objects.select_related('user').get(token=token)
             
             if reset_token.is_used:
                 return error_response(
@@ -283,10 +268,10 @@ def reset_password(request):
             # Reset password and mark token as used
             user = reset_token.user
             user.set_password(new_password)
-            user.save()
+            user.save(update_fields=['password', 'updated_at'])
             
             reset_token.is_used = True
-            reset_token.save()
+            reset_token.save(update_fields=['is_used'])
             
             return success_response("Password reset successfully")
             
@@ -317,7 +302,7 @@ def change_password(request):
         
         user = request.user
         user.set_password(new_password)
-        user.save()
+        user.save(update_fields=['password', 'updated_at'])
         
         return success_response("Password updated successfully")
     
@@ -383,9 +368,19 @@ def refresh_token(request):
         )
 
 
-@api_view(['GET'])
+@api_view(['GET', 'PUT'])
 @permission_classes([IsAuthenticated])
 def profile(request):
+    """
+    Get or update the user profile.
+    """
+    if request.method == 'PUT':
+        return update_profile(request)
+    
+    return get_profile(request)
+
+
+def get_profile(request):
     """
     Get user profile.
     """
@@ -396,8 +391,6 @@ def profile(request):
     )
 
 
-@api_view(['PUT'])
-@permission_classes([IsAuthenticated])
 def update_profile(request):
     """
     Update user profile.
@@ -405,10 +398,10 @@ def update_profile(request):
     serializer = UserProfileSerializer(request.user, data=request.data, partial=True)
     
     if serializer.is_valid():
-        serializer.save()
+        user = serializer.save()
         return success_response(
             "Profile updated successfully",
-            serializer.data
+            serializer.to_representation(user)
         )
     
     return error_response(
@@ -40,6 +40,7 @@ class BookingAdmin(admin.ModelAdmin):
     ]
     readonly_fields = ['id', 'confirmation_number', 'created_at', 'updated_at']
     ordering = ['-created_at']
+    list_per_page = 50
     
     fieldsets = (
         ('Booking Information', {
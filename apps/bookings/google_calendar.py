@@ -0,0 +1,141 @@
+"""
+Google Calendar helpers shared by the booking views and tasks.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from datetime import datetime, time
+from google.auth.transport.requests import AuthorizedSession
+from google.oauth2 import service_account
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import quote
+import os
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+# Your constants
+SERVICE_ACCOUNT_FILE = getattr(settings, 'GOOGLE_SERVICE_ACCOUNT_JSON', 
+                              os.path.join(os.path.dirname(__file__), 'service_account.json'))
+SCOPES = ["https://www.googleapis.com/auth/calendar"]
+CALENDAR_ID = getattr(settings, 'GOOGLE_CALENDAR_ID', "muhammadobaidullah1122@gmail.com")
+CALENDAR_API_URL = "https://www.googleapis.com/calendar/v3"
+CALENDAR_API_TIMEOUT = 10  # seconds
+FREEBUSY_CACHE_TIMEOUT = 60  # seconds
+CALENDAR_TIMEZONE = "Asia/Karachi"  # your working timezone
+
+_KARACHI = ZoneInfo(CALENDAR_TIMEZONE)
+
+
+class CalendarServerError(requests.HTTPError):
+    """A 5xx response from the Calendar API; safe to retry."""
+
+
+@lru_cache(maxsize=None)
+def get_calendar_credentials():
+    """Load the service account credentials once per process."""
+    return service_account.Credentials.from_service_account_file(
+        SERVICE_ACCOUNT_FILE, scopes=SCOPES
+    )
+
+
+@lru_cache(maxsize=None)
+def get_calendar_session():
+    """
+    Return the authorized HTTP session for the Calendar API, created on first use.
+    The pooled connections keep TLS sessions to Google open between requests.
+    """
+    session = AuthorizedSession(get_calendar_credentials())
+    session.mount("https://", HTTPAdapter(pool_maxsize=32))
+    return session
+
+
+def query_freebusy(body):
+    """Run a FreeBusy query and return the decoded response."""
+    response = get_calendar_session().post(
+        f"{CALENDAR_API_URL}/freeBusy", json=body, timeout=CALENDAR_API_TIMEOUT
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def insert_event(calendar_id, event):
+    """
+    Create an event on a calendar and return the decoded response.
+    Server errors raise CalendarServerError so callers can retry just those.
+    """
+    response = get_calendar_session().post(
+        f"{CALENDAR_API_URL}/calendars/{quote(calendar_id)}/events",
+        json=event,
+        timeout=CALENDAR_API_TIMEOUT
+    )
+    if response.status_code >= 500:
+        raise CalendarServerError(
+            f"{response.status_code} Server Error for url: {response.url}", response=response
+        )
+    response.raise_for_status()
+    return response.json()
+
+
+def freebusy_cache_key(calendar_id, date):
+    """Return the cache key holding a calendar's busy periods for a date."""
+    return f"freebusy:{calendar_id}:{date.isoformat()}"
+
+
+@lru_cache(maxsize=256)
+def parse_busy_time(value):
+    """Convert a FreeBusy RFC 3339 timestamp to epoch seconds."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def get_free_slots(date, calendar_id):
+    """
+    Get free 30-min slots from Google Calendar between 09:00–20:00
+    """
+    # Define working hours - create timezone-aware datetimes
+    start_of_day = datetime.combine(date, time(9, 0), tzinfo=_KARACHI)
+    end_of_day = datetime.combine(date, time(20, 0), tzinfo=_KARACHI)
+
+    # FreeBusy query
+    freebusy_query = {
+        "timeMin": start_of_day.isoformat(),
+        "timeMax": end_of_day.isoformat(),
+        "timeZone": CALENDAR_TIMEZONE,
+        "items": [{"id": calendar_id}],
+    }
+    cache_key = freebusy_cache_key(calendar_id, date)
+    busy_slots = cache.get(cache_key)
+    if busy_slots is None:
+        busy_times = query_freebusy(freebusy_query)
+        busy_slots = busy_times["calendars"][calendar_id].get("busy", [])
+        cache.set(cache_key, busy_slots, FREEBUSY_CACHE_TIMEOUT)
+
+    # Generate 30-min slots, tracking minutes since midnight to avoid datetime math
+    slots = []
+    date_prefix = date.strftime("%Y-%m-%d ")
+    day_start_ts = start_of_day.timestamp()
+    minute = 9 * 60
+    end_minute = 20 * 60
+    i = 0
+
+    while minute < end_minute:
+        slot_start_ts = day_start_ts + (minute - 9 * 60) * 60
+        slot_end_ts = slot_start_ts + 30 * 60
+
+        # Google returns busy periods in ascending order, so skip those that end before this slot
+        while i < len(busy_slots) and parse_busy_time(busy_slots[i]["end"]) <= slot_start_ts:
+            i += 1
+        is_busy = i < len(busy_slots) and parse_busy_time(busy_slots[i]["start"]) < slot_end_ts
+
+        if not is_busy:
+            start_hh, start_mm = divmod(minute, 60)
+            end_hh, end_mm = divmod(minute + 30, 60)
+            slots.append(
+                {
+                    "start": f"{date_prefix}{start_hh:02d}:{start_mm:02d}",
+                    "end": f"{date_prefix}{end_hh:02d}:{end_mm:02d}",
+                }
+            )
+
+        minute += 30
+
+    return slots
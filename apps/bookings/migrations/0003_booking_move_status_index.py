@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-15 20:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0002_alter_booking_unique_together_booking_end_time_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['move', 'status'], name='bookings_move_id_fa3dfe_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-15 20:04
+
+from django.db import migrations, models
+
+
+def populate_time_slot_display(apps, schema_editor):
+    Booking = apps.get_model('bookings', 'Booking')
+    bookings = list(Booking.objects.only('id', 'start_time', 'end_time'))
+    for booking in bookings:
+        booking.time_slot_display = (
+            f"{booking.start_time.strftime('%H:%M')} - {booking.end_time.strftime('%H:%M')}"
+        )
+    Booking.objects.bulk_update(bookings, ['time_slot_display'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0003_booking_move_status_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='time_slot_display',
+            field=models.CharField(blank=True, editable=False, max_length=32),
+        ),
+        migrations.RunPython(populate_time_slot_display, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-15 20:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0004_booking_time_slot_display'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['user', '-created_at'], name='bookings_user_id_b98b83_idx'),
+        ),
+    ]
@@ -34,11 +34,7 @@ class TimeSlot(models.Model):
     
     def is_available_on_date(self, date):
         """Check if this time slot is available on a specific date."""
-        return not Booking.objects.filter(
-            time_slot=self,
-            date=date,
-            status__in=['confirmed', 'in_progress']
-        ).exists()
+        return (self.start_time, self.end_time) not in Booking.booked_times_on_date(date)
 
 
 class Booking(models.Model, ChoicesMixin):
@@ -56,6 +52,7 @@ class Booking(models.Model, ChoicesMixin):
     # Instead of FK, store actual times
     start_time = models.TimeField()
     end_time = models.TimeField()
+    time_slot_display = models.CharField(max_length=32, blank=True, editable=False)
 
     # Booking details
     date = models.DateField()
@@ -81,6 +78,10 @@ class Booking(models.Model, ChoicesMixin):
         verbose_name_plural = 'Bookings'
         ordering = ['-created_at']
         unique_together = ['date', 'start_time', 'end_time']  # prevent double booking
+        indexes = [
+            models.Index(fields=['move', 'status']),
+            models.Index(fields=['user', '-created_at']),
+        ]
 
     def __str__(self):
         return f"Booking {self.confirmation_number} - {self.date} {self.start_time}-{self.end_time}"
@@ -88,15 +89,26 @@ class Booking(models.Model, ChoicesMixin):
     def save(self, *args, **kwargs):
         if not self.confirmation_number:
             self.confirmation_number = self.generate_confirmation_number()
+        self.time_slot_display = self.format_time_slot(self.start_time, self.end_time)
         super().save(*args, **kwargs)
 
+    @classmethod
+    def booked_times_on_date(cls, date):
+        """Return the set of (start_time, end_time) pairs actively booked on a date."""
+        return set(
+            cls.objects.filter(
+                date=date,
+                status__in=['confirmed', 'in_progress']
+            ).values_list('start_time', 'end_time')
+        )
+
     def generate_confirmation_number(self):
         while True:
             confirmation = 'BK' + ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
             if not Booking.objects.filter(confirmation_number=confirmation).exists():
                 return confirmation
     
-    @property
-    def time_slot_display(self):
+    @staticmethod
+    def format_time_slot(start_time, end_time):
         """Return formatted time slot string."""
-        return f"{self.start_time.strftime('%H:%M')} - {self.end_time.strftime('%H:%M')}"
+        return f"{start_time.strftime('%H:%M')} - {end_time.strftime('%H:%M')}"
@@ -5,11 +5,15 @@ from rest_framework import serializers
 from django.utils import timezone
 from .models import TimeSlot, Booking
 from apps.moves.models import Move
+from apps.common.utils import CachedFieldsMixin
 import re
 from datetime import datetime
 
+_TIME_SLOT_RE = re.compile(r'^\d{2}:\d{2}-\d{2}:\d{2}$')
+_PHONE_RE = re.compile(r'^[\+\d\s\-\(\)]{8,20}$')
 
-class TimeSlotSerializer(serializers.ModelSerializer):
+
+class TimeSlotSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for time slots.
     """
@@ -22,9 +26,14 @@ class TimeSlotSerializer(serializers.ModelSerializer):
     def get_available(self, obj):
         """Check if time slot is available for the requested date."""
         date = self.context.get('date')
-        if date:
-            return obj.is_available_on_date(date)
-        return True
+        if not date:
+            return True
+        # Booked times are looked up once and shared by every row of a list
+        booked_times = self.context.get('booked_times')
+        if booked_times is None:
+            booked_times = Booking.booked_times_on_date(date)
+            self.context['booked_times'] = booked_times
+        return (obj.start_time, obj.end_time) not in booked_times
 
 
 class BookingCreateSerializer(serializers.ModelSerializer):
@@ -51,8 +60,7 @@ class BookingCreateSerializer(serializers.ModelSerializer):
 
     def validate_time_slot(self, value):
         """Validate time slot format (HH:MM-HH:MM)."""
-        pattern = r'^\d{2}:\d{2}-\d{2}:\d{2}$'
-        if not re.match(pattern, value):
+        if not _TIME_SLOT_RE.match(value):
             raise serializers.ValidationError(
                 "Time slot must be in format HH:MM-HH:MM (e.g., 10:00-11:00)"
             )
@@ -60,8 +68,7 @@ class BookingCreateSerializer(serializers.ModelSerializer):
 
     def validate_phone_number(self, value):
         """Validate phone number format."""
-        pattern = r'^[\+\d\s\-\(\)]{8,20}$'
-        if not re.match(pattern, value):
+        if not _PHONE_RE.match(value):
             raise serializers.ValidationError(
                 "Phone number must be 8-20 characters and can include +, spaces, hyphens, and parentheses"
             )
@@ -104,18 +111,17 @@ class BookingCreateSerializer(serializers.ModelSerializer):
         )
 
         # Update move status to scheduled
+        Move.objects.filter(pk=move.pk).update(status='scheduled', updated_at=timezone.now())
         move.status = 'scheduled'
-        move.save()
 
         return booking
 
 
-class BookingDetailSerializer(serializers.ModelSerializer):
+class BookingDetailSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for booking details.
     """
-    time_slot_display = serializers.CharField(read_only=True)
-    move_id = serializers.UUIDField(source='move.id', read_only=True)
+    move_id = serializers.UUIDField(read_only=True)
     
     class Meta:
         model = Booking
@@ -124,16 +130,15 @@ class BookingDetailSerializer(serializers.ModelSerializer):
             'status', 'confirmation_number', 'phone_number', 'created_at'
         ]
         read_only_fields = [
-            'id', 'confirmation_number', 'created_at'
+            'id', 'time_slot_display', 'confirmation_number', 'created_at'
         ]
 
 
-class BookingListSerializer(serializers.ModelSerializer):
+class BookingListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for booking list (summary view).
     """
-    time_slot_display = serializers.CharField(read_only=True)
-    move_id = serializers.UUIDField(source='move.id', read_only=True)
+    move_id = serializers.UUIDField(read_only=True)
     
     class Meta:
         model = Booking
@@ -142,5 +147,5 @@ class BookingListSerializer(serializers.ModelSerializer):
             'status', 'confirmation_number', 'created_at'
         ]
         read_only_fields = [
-            'id', 'confirmation_number', 'created_at'
+            'id', 'time_slot_display', 'confirmation_number', 'created_at'
         ]
@@ -0,0 +1,62 @@
+"""
+Celery tasks for booking-related Google Calendar syncing.
+"""
+from celery import shared_task
+from django.core.cache import cache
+import logging
+import requests
+from .models import Booking
+from .google_calendar import (
+    CALENDAR_ID, CALENDAR_TIMEZONE, CalendarServerError, insert_event, freebusy_cache_key
+)
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(requests.ConnectionError, requests.Timeout, CalendarServerError),
+    retry_backoff=True,
+    max_retries=5
+)
+def create_calendar_event(self, booking_id):
+    """
+    Create the Google Calendar event for a booking.
+    Only network errors and 5xx responses are retried, with backoff. The event id
+    is derived from the booking id, so a retry can never create a duplicate.
+    """
+    try:
+        booking = Booking.objects.select_related('user').get(id=booking_id)
+    except Booking.DoesNotExist:
+        logger.error(f"Booking with id {booking_id} not found")
+        return
+
+    event = {
+        # Lowercase hex is valid base32hex, as the Calendar API requires for ids
+        "id": booking.id.hex,
+        "summary": f"Move Booking - {booking.user.username}",
+        "description": f"Phone: {booking.phone_number}, Confirmation: {booking.confirmation_number}",
+        "start": {
+            "dateTime": f"{booking.date}T{booking.start_time}",
+            "timeZone": CALENDAR_TIMEZONE,
+        },
+        "end": {
+            "dateTime": f"{booking.date}T{booking.end_time}",
+            "timeZone": CALENDAR_TIMEZONE,
+        },
+    }
+
+    try:
+        insert_event(CALENDAR_ID, event)
+    except CalendarServerError:
+        raise
+    except requests.HTTPError as e:
+        if e.response is None or e.response.status_code != 409:
+            logger.error(f"Calendar event for booking {booking.confirmation_number} rejected: {e}")
+            return
+        # 409 means an earlier attempt already created the event
+
+    # Make the newly booked slot disappear from cached availability
+    cache.delete(freebusy_cache_key(CALENDAR_ID, booking.date))
+
+    logger.info(f"Calendar event created for booking {booking.confirmation_number}")
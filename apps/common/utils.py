@@ -1,13 +1,21 @@
 """
 Common utility functions for the RemoveList application.
 """
+import copy
 import uuid
 import re
 from django.core.exceptions import ValidationError
+from django.utils.functional import cached_property
 from django.core.validators import validate_email as django_validate_email
 from rest_framework.response import Response
 from rest_framework import status
 
+_PHONE_NUMBER_RE = re.compile(r'^\+\d{10,15}$')
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\-_\.]')
+
+# Upper bound on rows returned by list endpoints when no page is requested
+MAX_UNPAGINATED_RESULTS = 500
+
 
 def generate_uuid():
     """Generate a UUID string."""
@@ -30,8 +38,7 @@ def validate_phone_number(phone_number):
     Validate phone number format.
     Must start with + followed by country code and 10-15 digits.
     """
-    pattern = r'^\+\d{10,15}$'
-    return bool(re.match(pattern, phone_number))
+    return bool(_PHONE_NUMBER_RE.match(phone_number))
 
 
 def sanitize_filename(filename):
@@ -42,7 +49,7 @@ def sanitize_filename(filename):
     filename = filename.split('/')[-1].split('\\')[-1]
     
     # Remove or replace dangerous characters
-    filename = re.sub(r'[^\w\-_\.]', '_', filename)
+    filename = _UNSAFE_FILENAME_CHARS_RE.sub('_', filename)
     
     # Limit length
     if len(filename) > 100:
@@ -79,33 +86,46 @@ def error_response(message, errors=None, status_code=status.HTTP_400_BAD_REQUEST
     return Response(response_data, status=status_code)
 
 
-def paginated_response(queryset, serializer_class, request, message="Data retrieved successfully"):
+def get_page(queryset, request, default_page_size=None):
     """
-    Create a paginated response with consistent format.
+    Get the requested page of a queryset from the page and page_size query parameters.
     """
     from django.core.paginator import Paginator
     from django.conf import settings
     
-    page_size = request.GET.get('page_size', settings.REST_FRAMEWORK['PAGE_SIZE'])
+    default_page_size = default_page_size or settings.REST_FRAMEWORK['PAGE_SIZE']
+    page_size = request.GET.get('page_size', default_page_size)
     page_number = request.GET.get('page', 1)
     
     try:
         page_size = int(page_size)
         page_number = int(page_number)
     except (ValueError, TypeError):
-        page_size = settings.REST_FRAMEWORK['PAGE_SIZE']
+        page_size = default_page_size
         page_number = 1
     
-    paginator = Paginator(queryset, page_size)
-    page_obj = paginator.get_page(page_number)
+    # Non-positive sizes are invalid and fall back to the default
+    if page_size < 1:
+        page_size = default_page_size
+    
+    paginator = Paginator(queryset, max(1, min(page_size, MAX_UNPAGINATED_RESULTS)))
+    return paginator.get_page(page_number)
+
+
+def paginated_response(queryset, serializer_class, request, message="Data retrieved successfully", page=None):
+    """
+    Create a paginated response with consistent format.
+    Pass page when the view already fetched it with get_page().
+    """
+    page_obj = page if page is not None else get_page(queryset, request)
     
     serializer = serializer_class(page_obj.object_list, many=True, context={'request': request})
     
     data = {
         'results': serializer.data,
-        'count': paginator.count,
-        'page': page_number,
-        'total_pages': paginator.num_pages,
+        'count': page_obj.paginator.count,
+        'page': page_obj.number,
+        'total_pages': page_obj.paginator.num_pages,
         'next': page_obj.next_page_number() if page_obj.has_next() else None,
         'previous': page_obj.previous_page_number() if page_obj.has_previous() else None,
     }
@@ -131,3 +151,41 @@ class ChoicesMixin:
         if hasattr(cls, 'CHOICES'):
             return [choice[0] for choice in cls.CHOICES]
         return []
+
+
+class CachedFieldsMixin:
+    """
+    Mixin for serializers to build their fields from model introspection once per class.
+
+    Each instance still receives its own copy of the fields, so binding and
+    context stay per instance.
+    """
+    
+    def get_fields(self):
+        """Return a copy of the fields built on first use of this class."""
+        cls = self.__class__
+        fields = cls.__dict__.get('_cached_fields')
+        if fields is None:
+            fields = super().get_fields()
+            cls._cached_fields = fields
+        return copy.deepcopy(fields)
+    
+    @cached_property
+    def _readable_fields(self):
+        """Readable fields, collected once instead of on every to_representation()."""
+        return tuple(field for field in self.fields.values() if not field.write_only)
+
+
+class UpdateFieldsMixin:
+    """
+    Mixin for model serializers to save only the fields that were submitted.
+
+    Lets model save() overrides tell which fields changed via update_fields.
+    """
+    
+    def update(self, instance, validated_data):
+        """Apply validated data and save just those columns plus updated_at."""
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        instance.save(update_fields=[*validated_data, 'updated_at'])
+        return instance
@@ -6,14 +6,15 @@ from django.core.exceptions import ValidationError
 from django.core.validators import validate_email as django_validate_email
 from django.utils.translation import gettext_lazy as _
 
+_PHONE_NUMBER_RE = re.compile(r'^\+\d{10,15}$')
+
 
 def validate_phone_number(value):
     """
     Validate phone number format.
     Must start with + followed by country code and 10-15 digits.
     """
-    pattern = r'^\+\d{10,15}$'
-    if not re.match(pattern, value):
+    if not _PHONE_NUMBER_RE.match(value):
         raise ValidationError(
             _('Phone number must start with country code (+) followed by 10-15 digits.'),
             code='invalid_phone'
@@ -21,6 +21,7 @@ class InventoryRoomAdmin(admin.ModelAdmin):
     ]
     readonly_fields = ['id', 'created_at', 'updated_at', 'total_items_count']
     ordering = ['-created_at']
+    list_per_page = 50
     
     fieldsets = (
         ('Room Information', {
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-15 20:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='inventoryroom',
+            index=models.Index(fields=['move', 'created_at'], name='inventory_r_move_id_c684b3_idx'),
+        ),
+    ]
@@ -2,15 +2,28 @@
 Models for inventory management.
 """
 import uuid
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Func, IntegerField
 from django.contrib.auth import get_user_model
 from apps.moves.models import Move
+from apps.moves.tasks import recalc_move_progress
 from apps.common.utils import ChoicesMixin
 from apps.common.validators import validate_image_file
 
 User = get_user_model()
 
 
+class JSONArrayLength(Func):
+    """
+    Length of a JSON array column, computed by the database.
+    """
+    function = 'JSON_ARRAY_LENGTH'
+    output_field = IntegerField()
+    
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return super().as_sql(compiler, connection, function='JSONB_ARRAY_LENGTH', **extra_context)
+
+
 class InventoryRoom(models.Model, ChoicesMixin):
     """
     Model representing a room in the inventory.
@@ -54,18 +67,35 @@ class InventoryRoom(models.Model, ChoicesMixin):
         verbose_name = 'Inventory Room'
         verbose_name_plural = 'Inventory Rooms'
         ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['move', 'created_at']),
+        ]
     
     def __str__(self):
         return f"{self.name} ({self.get_type_display()}) - {self.move}"
     
     def save(self, *args, **kwargs):
-        """Update move progress when room is saved."""
+        """Queue a move progress update when a room is added or its packed state is saved."""
         super().save(*args, **kwargs)
-        # Trigger progress calculation for the move
-        if hasattr(self.move, 'calculate_progress'):
-            self.move.calculate_progress()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'packed' in update_fields:
+            # Recalculate progress in the background once the room is committed
+            move_id = str(self.move_id)
+            transaction.on_commit(lambda: recalc_move_progress.delay(move_id), robust=True)
+    
+    @classmethod
+    def total_items_count_expression(cls):
+        """Database expression equivalent to total_items_count, for annotations."""
+        return JSONArrayLength('items') + F('boxes') + F('heavy_items')
     
     @property
     def total_items_count(self):
         """Get total count of items in the room."""
+        if '_total_items_count' in self.__dict__:
+            return self._total_items_count
         return len(self.items) + self.boxes + self.heavy_items
+    
+    @total_items_count.setter
+    def total_items_count(self, value):
+        """Store a total_items_count annotated by the database."""
+        self._total_items_count = value
@@ -4,12 +4,14 @@ Serializers for inventory management.
 from rest_framework import serializers
 from .models import InventoryRoom
 from apps.moves.models import Move
+from apps.common.utils import UpdateFieldsMixin
 
 
 class InventoryRoomCreateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating an inventory room.
     """
+    move_id = serializers.UUIDField(write_only=True)
     
     class Meta:
         model = InventoryRoom
@@ -37,7 +39,7 @@ class InventoryRoomCreateSerializer(serializers.ModelSerializer):
         return InventoryRoom.objects.create(move=move, **validated_data)
 
 
-class InventoryRoomUpdateSerializer(serializers.ModelSerializer):
+class InventoryRoomUpdateSerializer(UpdateFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for updating an inventory room.
     """
@@ -77,7 +79,7 @@ class InventoryRoomDetailSerializer(serializers.ModelSerializer):
     """
     Serializer for inventory room details.
     """
-    total_items_count = serializers.ReadOnlyField()
+    total_items_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = InventoryRoom
@@ -92,7 +94,7 @@ class InventoryRoomListSerializer(serializers.ModelSerializer):
     """
     Serializer for inventory room list (summary view).
     """
-    total_items_count = serializers.ReadOnlyField()
+    total_items_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = InventoryRoom
@@ -103,7 +105,7 @@ class InventoryRoomListSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'total_items_count']
 
 
-class RoomPackedSerializer(serializers.ModelSerializer):
+class RoomPackedSerializer(UpdateFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for marking room as packed/unpacked.
     """
@@ -113,7 +115,7 @@ class RoomPackedSerializer(serializers.ModelSerializer):
         fields = ['packed']
 
 
-class RoomImageUploadSerializer(serializers.ModelSerializer):
+class RoomImageUploadSerializer(UpdateFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for room image upload.
     """
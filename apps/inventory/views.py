@@ -4,6 +4,7 @@ Views for inventory management.
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from .models import InventoryRoom
 from .serializers import (
@@ -12,11 +13,18 @@ from .serializers import (
     RoomPackedSerializer, RoomImageUploadSerializer
 )
 from apps.moves.models import Move
-from apps.common.utils import success_response, error_response, paginated_response
+from apps.common.utils import (
+    success_response, error_response, paginated_response, MAX_UNPAGINATED_RESULTS
+)
+
+
+def get_user_room(request, room_id):
+    """
+    Get a room whose move belongs to the current user, or raise 404.
+    """
+    return get_object_or_404(InventoryRoom, id=room_id, move__user_id=request.user.id)
 
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
 def get_rooms(request):
     """
     Get inventory rooms for a specific move.
@@ -31,22 +39,29 @@ def get_rooms(request):
         )
     
     # Verify move belongs to user
-    move = get_object_or_404(Move, id=move_id, user=request.user)
+    move = get_object_or_404(Move.objects.only('id'), id=move_id, user=request.user)
     
     # Get rooms for this move
-    rooms = InventoryRoom.objects.filter(move=move)
+    rooms = InventoryRoom.objects.filter(move_id=move.id).annotate(
+        total_items_count=InventoryRoom.total_items_count_expression()
+    )
     
     # Check if pagination is requested
     if request.GET.get('page'):
+        # The summary serializer skips items, image and move_id, so don't load them
         return paginated_response(
-            rooms,
+            rooms.only('id', 'name', 'type', 'boxes', 'heavy_items', 'packed', 'created_at'),
             InventoryRoomListSerializer,
             request,
             "Rooms retrieved successfully"
         )
     
     # Return all rooms without pagination
-    serializer = InventoryRoomDetailSerializer(rooms, many=True)
+    rooms = rooms.only(
+        'id', 'name', 'type', 'items', 'boxes', 'heavy_items',
+        'image', 'packed', 'created_at', 'move_id'
+    )
+    serializer = InventoryRoomDetailSerializer(rooms[:MAX_UNPAGINATED_RESULTS], many=True)
     
     return success_response(
         "Rooms retrieved successfully",
@@ -54,8 +69,6 @@ def get_rooms(request):
     )
 
 
-@api_view(['POST'])
-@permission_classes([IsAuthenticated])
 def create_room(request):
     """
     Create a new inventory room.
@@ -81,13 +94,23 @@ def create_room(request):
     )
 
 
-@api_view(['GET'])
+@api_view(['GET', 'POST'])
 @permission_classes([IsAuthenticated])
+def rooms_collection(request):
+    """
+    List rooms for a move or create a new room.
+    """
+    if request.method == 'POST':
+        return create_room(request)
+    
+    return get_rooms(request)
+
+
 def get_room(request, room_id):
     """
     Get room details by ID.
     """
-    room = get_object_or_404(InventoryRoom, id=room_id, move__user=request.user)
+    room = get_user_room(request, room_id)
     
     serializer = InventoryRoomDetailSerializer(room)
     
@@ -97,13 +120,11 @@ def get_room(request, room_id):
     )
 
 
-@api_view(['PUT'])
-@permission_classes([IsAuthenticated])
 def update_room(request, room_id):
     """
     Update an inventory room.
     """
-    room = get_object_or_404(InventoryRoom, id=room_id, move__user=request.user)
+    room = get_user_room(request, room_id)
     
     serializer = InventoryRoomUpdateSerializer(room, data=request.data, partial=True)
     
@@ -131,7 +152,7 @@ def mark_room_packed(request, room_id):
     """
     Mark room as packed or unpacked.
     """
-    room = get_object_or_404(InventoryRoom, id=room_id, move__user=request.user)
+    room = get_user_room(request, room_id)
     
     serializer = RoomPackedSerializer(room, data=request.data, partial=True)
     
@@ -153,26 +174,40 @@ def mark_room_packed(request, room_id):
     )
 
 
-@api_view(['DELETE'])
-@permission_classes([IsAuthenticated])
 def delete_room(request, room_id):
     """
     Delete an inventory room.
     """
-    room = get_object_or_404(InventoryRoom, id=room_id, move__user=request.user)
+    deleted, _ = InventoryRoom.objects.filter(id=room_id, move__user_id=request.user.id).delete()
     
-    room.delete()
+    if not deleted:
+        raise Http404
     
     return success_response("Room deleted successfully")
 
 
+@api_view(['GET', 'PUT', 'PATCH', 'DELETE'])
+@permission_classes([IsAuthenticated])
+def room_detail(request, room_id):
+    """
+    Get, update or delete an inventory room.
+    """
+    if request.method in ('PUT', 'PATCH'):
+        return update_room(request, room_id)
+    
+    if request.method == 'DELETE':
+        return delete_room(request, room_id)
+    
+    return get_room(request, room_id)
+
+
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def upload_room_image(request, room_id):
     """
     Upload image for an inventory room.
     """
-    room = get_object_or_404(InventoryRoom, id=room_id, move__user=request.user)
+    room = get_user_room(request, room_id)
     
     serializer = RoomImageUploadSerializer(room, data=request.data, partial=True)
     
@@ -3,6 +3,8 @@ Models for move management.
 """
 import uuid
 from django.db import models
+from django.db.models import Count, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from apps.common.validators import validate_future_date
@@ -71,6 +73,13 @@ class Move(models.Model, ChoicesMixin):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # Related rows counted towards progress, with the flag marking each one done
+    PROGRESS_RELATIONS = [
+        ('timeline_events', 'completed'),
+        ('checklist_items', 'completed'),
+        ('inventory_rooms', 'packed'),
+    ]
+    
     class Meta:
         db_table = 'moves'
         verbose_name = 'Move'
@@ -84,35 +93,60 @@ class Move(models.Model, ChoicesMixin):
         """
         Calculate move progress based on completed tasks and checklist items.
         """
-        # This will be implemented when we have timeline and checklist models
         total_tasks = 0
         completed_tasks = 0
         
-        # Count timeline events
-        if hasattr(self, 'timeline_events'):
-            timeline_events = self.timeline_events.all()
-            total_tasks += timeline_events.count()
-            completed_tasks += timeline_events.filter(completed=True).count()
-        
-        # Count checklist items
-        if hasattr(self, 'checklist_items'):
-            checklist_items = self.checklist_items.all()
-            total_tasks += checklist_items.count()
-            completed_tasks += checklist_items.filter(completed=True).count()
-        
-        # Count inventory rooms (if packed)
-        if hasattr(self, 'inventory_rooms'):
-            rooms = self.inventory_rooms.all()
-            total_tasks += rooms.count()
-            completed_tasks += rooms.filter(packed=True).count()
+        # One aggregate per related table: rows in total and rows marked done
+        for relation, done_field in self.PROGRESS_RELATIONS:
+            agg = getattr(self, relation).aggregate(
+                total=Count('id'), done=Count('id', filter=Q(**{done_field: True}))
+            )
+            total_tasks += agg['total']
+            completed_tasks += agg['done']
         
-        if total_tasks > 0:
-            progress = int((completed_tasks / total_tasks) * 100)
-            self.progress = min(progress, 100)
+        progress = self.progress_from_counts(total_tasks, completed_tasks)
+        if progress is not None:
+            self.progress = progress
             self.save(update_fields=['progress'])
         
         return self.progress
     
+    @staticmethod
+    def progress_from_counts(total_tasks, completed_tasks):
+        """Get the progress percentage, or None when there are no tasks."""
+        if total_tasks > 0:
+            return min(int((completed_tasks / total_tasks) * 100), 100)
+        return None
+    
+    def apply_progress_counts(self):
+        """
+        Set progress from the counts added by annotate_progress_counts.
+        Returns True if the progress changed and needs saving.
+        """
+        progress = self.progress_from_counts(self.progress_total, self.progress_done)
+        if progress is None or progress == self.progress:
+            return False
+        self.progress = progress
+        return True
+    
+    @classmethod
+    def annotate_progress_counts(cls, queryset):
+        """
+        Annotate progress_total and progress_done on a move queryset using correlated subqueries,
+        so progress for many moves can be computed from a single query.
+        """
+        total = Value(0)
+        done = Value(0)
+        for relation, done_field in cls.PROGRESS_RELATIONS:
+            related = cls._meta.get_field(relation).related_model.objects.filter(
+                move=OuterRef('pk')
+            ).order_by().values('move')
+            total += Coalesce(Subquery(related.annotate(c=Count('pk')).values('c')), 0)
+            done += Coalesce(
+                Subquery(related.filter(**{done_field: True}).annotate(c=Count('pk')).values('c')), 0
+            )
+        return queryset.annotate(progress_total=total, progress_done=done)
+    
     @property
     def is_upcoming(self):
         """Check if the move is upcoming (within 30 days)."""
@@ -2,59 +2,17 @@
 Serializers for move management.
 """
 from rest_framework import serializers
-from django.utils import timezone
 from .models import Move
 from apps.common.validators import validate_name
+from apps.common.utils import UpdateFieldsMixin
 
 
-class MoveCreateSerializer(serializers.ModelSerializer):
+class _MoveBaseSerializer(serializers.ModelSerializer):
     """
-    Serializer for creating a move.
+    Shared field validation for the move create and update serializers.
+    move_date is checked by the model's validate_future_date validator.
     """
     
-    class Meta:
-        model = Move
-        fields = [
-            'move_date', 'current_location', 'destination_location',
-            'from_property_type', 'from_property_size', 'to_property_type', 'to_property_size', 
-            'special_items', 'additional_details',
-            'first_name', 'last_name', 'email'
-        ]
-    
-    def validate_move_date(self, value):
-        """Validate that move date is in the future."""
-        if value <= timezone.now().date():
-            raise serializers.ValidationError("Move date must be in the future")
-        return value
-    
-    def validate_from_property_type(self, value):
-        """Validate from property type choice."""
-        valid_choices = [choice[0] for choice in Move.PROPERTY_TYPE_CHOICES]
-        if value not in valid_choices:
-            raise serializers.ValidationError(f"Invalid property type. Choose from: {', '.join(valid_choices)}")
-        return value
-    
-    def validate_from_property_size(self, value):
-        """Validate from property size choice."""
-        valid_choices = [choice[0] for choice in Move.PROPERTY_SIZE_CHOICES]
-        if value not in valid_choices:
-            raise serializers.ValidationError(f"Invalid property size. Choose from: {', '.join(valid_choices)}")
-        return value
-    
-    def validate_to_property_type(self, value):
-        """Validate to property type choice."""
-        valid_choices = [choice[0] for choice in Move.PROPERTY_TYPE_CHOICES]
-        if value not in valid_choices:
-            raise serializers.ValidationError(f"Invalid property type. Choose from: {', '.join(valid_choices)}")
-        return value
-    
-    def validate_to_property_size(self, value):
-        """Validate to property size choice."""
-        valid_choices = [choice[0] for choice in Move.PROPERTY_SIZE_CHOICES]
-        if value not in valid_choices:
-            raise serializers.ValidationError(f"Invalid property size. Choose from: {', '.join(valid_choices)}")
-        return value
-    
     def validate_first_name(self, value):
         """Validate first name."""
         validate_name(value)
@@ -65,6 +23,25 @@ class MoveCreateSerializer(serializers.ModelSerializer):
         validate_name(value)
         return value
     
+    def to_representation(self, instance):
+        """Return saved moves in the detail format."""
+        return MoveDetailSerializer(instance, context=self.context).to_representation(instance)
+
+
+class MoveCreateSerializer(_MoveBaseSerializer):
+    """
+    Serializer for creating a move.
+    """
+    
+    class Meta:
+        model = Move
+        fields = (
+            'move_date', 'current_location', 'destination_location',
+            'from_property_type', 'from_property_size', 'to_property_type', 'to_property_size', 
+            'special_items', 'additional_details',
+            'first_name', 'last_name', 'email'
+        )
+    
     def create(self, validated_data):
         """Create a move with the authenticated user."""
         user = self.context['request'].user
@@ -72,70 +49,19 @@ class MoveCreateSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class MoveUpdateSerializer(serializers.ModelSerializer):
+class MoveUpdateSerializer(UpdateFieldsMixin, _MoveBaseSerializer):
     """
     Serializer for updating a move.
     """
     
     class Meta:
         model = Move
-        fields = [
+        fields = (
             'move_date', 'current_location', 'destination_location',
             'from_property_type', 'from_property_size', 'to_property_type', 'to_property_size',
             'special_items', 'additional_details',
             'first_name', 'last_name', 'email', 'status'
-        ]
-    
-    def validate_move_date(self, value):
-        """Validate that move date is in the future."""
-        if value <= timezone.now().date():
-            raise serializers.ValidationError("Move date must be in the future")
-        return value
-    
-    def validate_from_property_type(self, value):
-        """Validate from property type choice."""
-        valid_choices = [choice[0] for choice in Move.PROPERTY_TYPE_CHOICES]
-        if value not in valid_choices:
-            raise serializers.ValidationError(f"Invalid property type. Choose from: {', '.join(valid_choices)}")
-        return value
-    
-    def validate_from_property_size(self, value):
-        """Validate from property size choice."""
-        valid_choices = [choice[0] for choice in Move.PROPERTY_SIZE_CHOICES]
-        if value not in valid_choices:
-            raise serializers.ValidationError(f"Invalid property size. Choose from: {', '.join(valid_choices)}")
-        return value
-    
-    def validate_to_property_type(self, value):
-        """Validate to property type choice."""
-        valid_choices = [choice[0] for choice in Move.PROPERTY_TYPE_CHOICES]
-        if value not in valid_choices:
-            raise serializers.ValidationError(f"Invalid property type. Choose from: {', '.join(valid_choices)}")
-        return value
-    
-    def validate_to_property_size(self, value):
-        """Validate to property size choice."""
-        valid_choices = [choice[0] for choice in Move.PROPERTY_SIZE_CHOICES]
-        if value not in valid_choices:
-            raise serializers.ValidationError(f"Invalid property size. Choose from: {', '.join(valid_choices)}")
-        return value
-    
-    def validate_status(self, value):
-        """Validate status choice."""
-        valid_choices = [choice[0] for choice in Move.STATUS_CHOICES]
-        if value not in valid_choices:
-            raise serializers.ValidationError(f"Invalid status. Choose from: {', '.join(valid_choices)}")
-        return value
-    
-    def validate_first_name(self, value):
-        """Validate first name."""
-        validate_name(value)
-        return value
-    
-    def validate_last_name(self, value):
-        """Validate last name."""
-        validate_name(value)
-        return value
+        )
 
 
 class MoveDetailSerializer(serializers.ModelSerializer):
@@ -145,14 +71,14 @@ class MoveDetailSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Move
-        fields = [
+        fields = (
             'id', 'move_date', 'current_location', 'destination_location',
             'from_property_type', 'from_property_size', 'to_property_type', 'to_property_size',
             'special_items', 'additional_details',
             'first_name', 'last_name', 'email', 'status', 'progress',
             'created_at', 'updated_at'
-        ]
-        read_only_fields = ['id', 'progress', 'created_at', 'updated_at']
+        )
+        read_only_fields = ('id', 'progress', 'created_at', 'updated_at')
 
 
 class MoveListSerializer(serializers.ModelSerializer):
@@ -162,8 +88,8 @@ class MoveListSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Move
-        fields = [
+        fields = (
             'id', 'move_date', 'current_location', 'destination_location',
             'status', 'progress', 'created_at'
-        ]
-        read_only_fields = ['id', 'progress', 'created_at']
+        )
+        read_only_fields = ('id', 'progress', 'created_at')
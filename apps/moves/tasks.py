@@ -0,0 +1,20 @@
+"""
+Celery tasks for move progress tracking.
+"""
+from celery import shared_task
+import logging
+from .models import Move
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def recalc_move_progress(move_id):
+    """
+    Recalculate and store the progress of a move.
+    """
+    try:
+        move = Move.objects.get(id=move_id)
+        move.calculate_progress()
+    except Move.DoesNotExist:
+        logger.error(f"Move with id {move_id} not found")
@@ -4,13 +4,16 @@ Views for move management.
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from .models import Move
 from .serializers import (
     MoveCreateSerializer, MoveUpdateSerializer, 
     MoveDetailSerializer, MoveListSerializer
 )
-from apps.common.utils import success_response, error_response, paginated_response
+from apps.common.utils import success_response, error_response, paginated_response, get_page
+
+_UNDELETABLE_STATUSES = frozenset(('in_progress', 'completed'))
 
 
 @api_view(['POST'])
@@ -22,14 +25,11 @@ def create_move(request):
     serializer = MoveCreateSerializer(data=request.data, context={'request': request})
     
     if serializer.is_valid():
-        move = serializer.save()
-        
-        # Return detailed move data
-        detail_serializer = MoveDetailSerializer(move)
+        serializer.save()
         
         return success_response(
             "Move created successfully",
-            detail_serializer.data,
+            serializer.data,
             status.HTTP_201_CREATED
         )
     
@@ -46,10 +46,13 @@ def get_move(request, move_id):
     """
     Get move details by ID.
     """
-    move = get_object_or_404(Move, id=move_id, user=request.user)
+    move = get_object_or_404(
+        Move.annotate_progress_counts(Move.objects.all()), id=move_id, user=request.user
+    )
     
     # Update progress before returning
-    move.calculate_progress()
+    if move.apply_progress_counts():
+        move.save(update_fields=['progress'])
     
     serializer = MoveDetailSerializer(move)
     
@@ -63,51 +66,42 @@ def get_move(request, move_id):
 @permission_classes([IsAuthenticated])
 def user_moves(request):
     """
-    Get all moves for the authenticated user.
+    Get the authenticated user's moves, one page at a time.
     """
-    moves = Move.objects.filter(user=request.user)
-    
-    # Update progress for all moves
-    for move in moves:
-        move.calculate_progress()
+    moves = Move.objects.filter(user=request.user).only(*MoveListSerializer.Meta.fields)
+    page = get_page(Move.annotate_progress_counts(moves), request, default_page_size=100)
+    page.object_list = list(page.object_list)
     
-    # Check if pagination is requested
-    if request.GET.get('page'):
-        return paginated_response(
-            moves, 
-            MoveListSerializer, 
-            request, 
-            "Moves retrieved successfully"
-        )
+    # Update progress for the moves on this page with a single bulk update
+    stale_moves = [move for move in page.object_list if move.apply_progress_counts()]
+    if stale_moves:
+        Move.objects.bulk_update(stale_moves, ['progress'])
     
-    # Return all moves without pagination
-    serializer = MoveListSerializer(moves, many=True)
-    
-    return success_response(
+    return paginated_response(
+        moves,
+        MoveListSerializer,
+        request,
         "Moves retrieved successfully",
-        serializer.data
+        page=page
     )
 
 
-@api_view(['PUT'])
+@api_view(['PUT', 'PATCH'])
 @permission_classes([IsAuthenticated])
 def update_move(request, move_id):
     """
-    Update a move.
+    Update a move (PUT replaces all fields, PATCH updates the given ones).
     """
     move = get_object_or_404(Move, id=move_id, user=request.user)
     
-    serializer = MoveUpdateSerializer(move, data=request.data, partial=True)
+    serializer = MoveUpdateSerializer(move, data=request.data, partial=request.method == 'PATCH')
     
     if serializer.is_valid():
         serializer.save()
         
-        # Return updated move data
-        detail_serializer = MoveDetailSerializer(move)
-        
         return success_response(
             "Move updated successfully",
-            detail_serializer.data
+            serializer.data
         )
     
     return error_response(
@@ -123,16 +117,21 @@ def delete_move(request, move_id):
     """
     Delete a move.
     """
-    move = get_object_or_404(Move, id=move_id, user=request.user)
+    # Lock the row while deleting so a concurrent status change cannot slip in between
+    # the status check and the cascade delete
+    with transaction.atomic():
+        move = Move.objects.select_for_update().filter(id=move_id, user=request.user).exclude(
+            status__in=_UNDELETABLE_STATUSES
+        ).first()
+        if move is not None:
+            move.delete()
     
-    # Check if move can be deleted (not in progress or completed)
-    if move.status in ['in_progress', 'completed']:
+    if move is None:
+        get_object_or_404(Move.objects.only('id'), id=move_id, user=request.user)
         return error_response(
             "Cannot delete move",
             {'detail': ['Cannot delete a move that is in progress or completed']},
             status.HTTP_400_BAD_REQUEST
         )
     
-    move.delete()
-    
     return success_response("Move deleted successfully")
@@ -0,0 +1,10 @@
+"""
+URL patterns for checklist item endpoints.
+"""
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('items/', views.checklist_items_collection, name='checklist_items_collection'),
+    path('items/<uuid:item_id>/', views.checklist_item_detail, name='checklist_item_detail'),
+]
@@ -77,6 +77,7 @@ class ChecklistItemCreateSerializer(serializers.ModelSerializer):
     """
     Serializer for creating custom checklist items.
     """
+    move_id = serializers.UUIDField(write_only=True)
     
     class Meta:
         model = ChecklistItem
@@ -13,7 +13,9 @@ from .serializers import (
     ChecklistItemUpdateSerializer, ChecklistWeekSerializer
 )
 from apps.moves.models import Move
-from apps.common.utils import success_response, error_response, paginated_response
+from apps.common.utils import (
+    success_response, error_response, paginated_response, MAX_UNPAGINATED_RESULTS
+)
 
 
 @api_view(['GET'])
@@ -47,7 +49,7 @@ def get_timeline_events(request):
         )
     
     # Return all events without pagination
-    serializer = TimelineEventSerializer(events, many=True)
+    serializer = TimelineEventSerializer(events[:MAX_UNPAGINATED_RESULTS], many=True)
     
     return success_response(
         "Timeline events retrieved",
@@ -83,8 +85,6 @@ def update_timeline_event(request, event_id):
     )
 
 
-@api_view(['GET'])
-@permission_classes([IsAuthenticated])
 def get_checklist_items(request):
     """
     Get checklist items for a specific move, grouped by week.
@@ -147,8 +147,6 @@ def get_checklist_items(request):
     )
 
 
-@api_view(['PATCH'])
-@permission_classes([IsAuthenticated])
 def update_checklist_item(request, item_id):
     """
     Update a checklist item (mainly completion status).
@@ -175,8 +173,6 @@ def update_checklist_item(request, item_id):
     )
 
 
-@api_view(['POST'])
-@permission_classes([IsAuthenticated])
 def add_custom_task(request):
     """
     Add a custom checklist item.
@@ -202,8 +198,6 @@ def add_custom_task(request):
     )
 
 
-@api_view(['DELETE'])
-@permission_classes([IsAuthenticated])
 def delete_custom_task(request, item_id):
     """
     Delete a custom checklist item.
@@ -223,6 +217,30 @@ def delete_custom_task(request, item_id):
     return success_response("Custom task deleted successfully")
 
 
+@api_view(['GET', 'POST'])
+@permission_classes([IsAuthenticated])
+def checklist_items_collection(request):
+    """
+    List checklist items for a move or add a custom task.
+    """
+    if request.method == 'POST':
+        return add_custom_task(request)
+    
+    return get_checklist_items(request)
+
+
+@api_view(['PATCH', 'DELETE'])
+@permission_classes([IsAuthenticated])
+def checklist_item_detail(request, item_id):
+    """
+    Update or delete a checklist item.
+    """
+    if request.method == 'DELETE':
+        return delete_custom_task(request, item_id)
+    
+    return update_checklist_item(request, item_id)
+
+
 def create_default_checklist_items(move):
     """
     Create default checklist items for a new move based on templates.
@@ -1,6 +1,5 @@
 # This will make sure the app is always imported when
 # Django starts so that shared_task will use this app.
-# DISABLED: Celery removed for development without Redis
-# from .celery import app as celery_app
+from .celery import app as celery_app
 
-# __all__ = ('celery_app',)
+__all__ = ('celery_app',)
@@ -5,15 +5,14 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from django.http import JsonResponse
+from django.http import HttpResponse
+
+# Pre-encoded so load balancer probes skip JSON serialization
+_HEALTH_BODY = b'{"success": true, "message": "RemoveList API is healthy", "status": "ok"}'
 
 def health_check(request):
     """Health check endpoint for monitoring."""
-    return JsonResponse({
-        'success': True,
-        'message': 'RemoveList API is healthy',
-        'status': 'ok'
-    })
+    return HttpResponse(_HEALTH_BODY, content_type='application/json')
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -23,7 +22,7 @@ urlpatterns = [
     path('api/booking/', include('apps.bookings.urls')),
     path('api/inventory/', include('apps.inventory.urls')),
     path('api/timeline/', include('apps.timeline.urls')),
-    path('api/checklist/', include('apps.timeline.urls')),  # Checklist is part of timeline
+    path('api/checklist/', include('apps.timeline.checklist_urls')),  # Checklist is part of timeline
     path('api/files/', include('apps.files.urls')),
 ]
 
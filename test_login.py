@@ -5,6 +5,11 @@ Test script for login API endpoint
 import requests
 import json
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
 # Test data
 login_data = {
     "email": "muhammadobaidu4llah1122@gmail.com",
@@ -21,11 +26,14 @@ try:
     print(f"Status Code: {response.status_code}")
     print(f"Response Headers: {dict(response.headers)}")
     print(f"Response Body:")
-    print(json.dumps(response.json(), indent=2))
+    if orjson:
+        print(orjson.dumps(orjson.loads(response.content), option=orjson.OPT_INDENT_2).decode())
+    else:
+        print(json.dumps(response.json(), indent=2))
     
 except requests.exceptions.RequestException as e:
     print(f"Request failed: {e}")
-except json.JSONDecodeError as e:
+except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
     print(f"JSON decode error: {e}")
     print(f"Raw response: {response.text}")
 except Exception as e: